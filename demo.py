@@ -4,12 +4,55 @@ Interactive Sky Simulator Demo
 Demonstrates the sky simulation from multiple locations and times
 """
 
-from sky_simulator import SkySimulator
+from sky_simulator import HAS_NUMBA, SkySimulator, style_polar_axes
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import numpy as np
+import os
 
-def demo_multiple_locations():
+def _map_frames(function, items):
+    """Apply function to every item, in parallel threads only on the NumPy path"""
+    # The Numba kernel already runs across all cores, and its default threading
+    # layer aborts the process when called from several threads at once
+    if HAS_NUMBA:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(function, items))
+
+def _polar_grid(fig, rows, cols, figsize):
+    """Lay out a rows x cols grid of polar axes on fig and return them flattened
+    
+    Creating polar axes is slow, so the axes fig already has are cleared and moved
+    into the new grid; only missing ones are created and surplus ones removed.
+    A figure whose window was closed is replaced by a new one.
+    """
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure()
+    else:
+        plt.figure(fig)  # The demos save and show the current figure
+    fig.set_size_inches(figsize)
+    # Undo the previous demo's tight_layout before placing the new grid
+    fig.subplots_adjust(**{name: plt.rcParams[f'figure.subplot.{name}']
+                           for name in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+    grid = fig.add_gridspec(rows, cols)
+    
+    axes = fig.axes
+    for extra in axes[rows * cols:]:
+        fig.delaxes(extra)
+    for i, spec in enumerate(grid):
+        if i < len(axes):
+            axes[i].clear()
+            # clear() keeps tick parameters; later demos rely on the default label size
+            axes[i].tick_params(axis='x', labelsize=plt.rcParams['xtick.labelsize'])
+            axes[i].tick_params(axis='y', labelsize=plt.rcParams['ytick.labelsize'])
+            axes[i].set_subplotspec(spec)
+            axes[i].set_visible(True)
+        else:
+            fig.add_subplot(spec, projection='polar')
+    return fig, np.array(fig.axes)
+
+def demo_multiple_locations(fig=None):
     """Show sky views from different locations at the same time"""
     simulator = SkySimulator()
     simulator.load_star_catalog(max_magnitude=4.0)
@@ -27,16 +70,16 @@ def demo_multiple_locations():
     observation_time = datetime(2024, 6, 15, 22, 0, 0)
     
     # Create subplots for each location
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12), subplot_kw=dict(projection='polar'))
-    axes = axes.flatten()
-    
-    for i, (lat, lon, name) in enumerate(locations):
-        if i >= len(axes):
-            break
-            
-        simulator.set_observer_location(lat, lon)
-        az, alt, sizes = simulator.get_star_positions(observation_time)
-        
+    fig, axes = _polar_grid(fig, 2, 3, (18, 12))
+    locations = locations[:len(axes)]
+    
+    # Evaluate every location (the observer is passed per call, so the simulator is
+    # shared safely); only the plotting below runs on the main thread
+    results = _map_frames(
+        lambda loc: simulator.get_star_positions(observation_time, latitude=loc[0], longitude=loc[1]),
+        locations)
+    
+    for i, ((lat, lon, name), (az, alt, sizes)) in enumerate(zip(locations, results)):
         ax = axes[i]
         
         if len(az) > 0:
@@ -44,15 +87,8 @@ def demo_multiple_locations():
             ax.scatter(az_rad, 90 - alt, s=sizes, c='white', alpha=0.8)
         
         # Configure subplot
-        ax.set_theta_zero_location('N')
-        ax.set_theta_direction(-1)
-        ax.set_ylim(0, 90)
-        ax.set_facecolor('black')
-        ax.grid(True, alpha=0.3)
-        ax.set_xticks(np.radians([0, 90, 180, 270]))
-        ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white', fontsize=8)
-        ax.tick_params(colors='white', labelsize=8)
-        ax.set_title(f'{name}\n{lat:.1f}°N, {lon:.1f}°W', color='white', fontsize=10)
+        style_polar_axes(ax, title=f'{name}\n{lat:.1f}°N, {lon:.1f}°W', fontsize=8,
+                         title_fontsize=10, title_pad=None)
     
     # Hide unused subplot
     if len(locations) < len(axes):
@@ -64,8 +100,9 @@ def demo_multiple_locations():
     plt.tight_layout()
     plt.savefig('multiple_locations.png', facecolor='black', dpi=150, bbox_inches='tight')
     plt.show()
+    return fig
 
-def demo_time_lapse():
+def demo_time_lapse(fig=None):
     """Show how the sky changes over time from one location"""
     simulator = SkySimulator()
     simulator.load_star_catalog(max_magnitude=3.5)  # Fewer stars for clarity
@@ -78,14 +115,13 @@ def demo_time_lapse():
     times = [start_time + timedelta(hours=i) for i in range(0, 25, 2)]
     
     # Create subplots
-    fig, axes = plt.subplots(3, 4, figsize=(16, 12), subplot_kw=dict(projection='polar'))
-    axes = axes.flatten()
-    
-    for i, time in enumerate(times):
-        if i >= len(axes):
-            break
-            
-        az, alt, sizes = simulator.get_star_positions(time)
+    fig, axes = _polar_grid(fig, 3, 4, (16, 12))
+    times = times[:len(axes)]
+    
+    # Compute all frames up front; matplotlib calls stay on the main thread
+    results = _map_frames(simulator.get_star_positions, times)
+    
+    for i, (time, (az, alt, sizes)) in enumerate(zip(times, results)):
         ax = axes[i]
         
         if len(az) > 0:
@@ -93,15 +129,8 @@ def demo_time_lapse():
             ax.scatter(az_rad, 90 - alt, s=sizes, c='white', alpha=0.8)
         
         # Configure subplot
-        ax.set_theta_zero_location('N')
-        ax.set_theta_direction(-1)
-        ax.set_ylim(0, 90)
-        ax.set_facecolor('black')
-        ax.grid(True, alpha=0.3)
-        ax.set_xticks(np.radians([0, 90, 180, 270]))
-        ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white', fontsize=8)
-        ax.tick_params(colors='white', labelsize=8)
-        ax.set_title(f'{time.strftime("%H:%M")}', color='white', fontsize=10)
+        style_polar_axes(ax, title=f'{time.strftime("%H:%M")}', fontsize=8,
+                         title_fontsize=10, title_pad=None)
     
     fig.suptitle('New York Sky - 24 Hour Time Lapse (June 15, 2024)', 
                  color='white', fontsize=16)
@@ -109,8 +138,9 @@ def demo_time_lapse():
     plt.tight_layout()
     plt.savefig('time_lapse.png', facecolor='black', dpi=150, bbox_inches='tight')
     plt.show()
+    return fig
 
-def demo_seasonal_comparison():
+def demo_seasonal_comparison(fig=None):
     """Compare the sky at the same time in different seasons"""
     simulator = SkySimulator()
     simulator.load_star_catalog(max_magnitude=4.0)
@@ -127,11 +157,12 @@ def demo_seasonal_comparison():
     ]
     
     # Create subplots
-    fig, axes = plt.subplots(2, 2, figsize=(12, 12), subplot_kw=dict(projection='polar'))
-    axes = axes.flatten()
+    fig, axes = _polar_grid(fig, 2, 2, (12, 12))
+    
+    # Compute all seasons up front; matplotlib calls stay on the main thread
+    results = _map_frames(simulator.get_star_positions, [time for time, _ in seasons])
     
-    for i, (time, season_name) in enumerate(seasons):
-        az, alt, sizes = simulator.get_star_positions(time)
+    for i, ((time, season_name), (az, alt, sizes)) in enumerate(zip(seasons, results)):
         ax = axes[i]
         
         if len(az) > 0:
@@ -139,16 +170,8 @@ def demo_seasonal_comparison():
             ax.scatter(az_rad, 90 - alt, s=sizes, c='white', alpha=0.8)
         
         # Configure subplot
-        ax.set_theta_zero_location('N')
-        ax.set_theta_direction(-1)
-        ax.set_ylim(0, 90)
-        ax.set_facecolor('black')
-        ax.grid(True, alpha=0.3)
-        ax.set_xticks(np.radians([0, 90, 180, 270]))
-        ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white')
-        ax.tick_params(colors='white')
-        ax.set_title(f'{season_name}\n{time.strftime("%B %d, 21:00")}', 
-                    color='white', fontsize=12)
+        style_polar_axes(ax, title=f'{season_name}\n{time.strftime("%B %d, 21:00")}',
+                         title_fontsize=12, title_pad=None)
     
     fig.suptitle('Seasonal Sky Comparison - Oregon (45°N, 122°W)', 
                  color='white', fontsize=16)
@@ -156,17 +179,20 @@ def demo_seasonal_comparison():
     plt.tight_layout()
     plt.savefig('seasonal_comparison.png', facecolor='black', dpi=150, bbox_inches='tight')
     plt.show()
+    return fig
 
 def main():
     """Run all demos"""
+    # The demos draw on one figure, reusing its polar axes from one layout to the next
     print("Generating Multiple Locations Demo...")
-    demo_multiple_locations()
+    fig = demo_multiple_locations()
     
     print("Generating Time Lapse Demo...")
-    demo_time_lapse()
+    fig = demo_time_lapse(fig)
     
     print("Generating Seasonal Comparison Demo...")
-    demo_seasonal_comparison()
+    demo_seasonal_comparison(fig)
+    plt.close('all')
     
     print("All demos complete! Check the generated PNG files.")
 
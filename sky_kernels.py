@@ -0,0 +1,78 @@
+"""
+Fast approximate sky kernels
+Closed-form sidereal time and alt/az geometry for when chart accuracy is enough
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional; the NumPy kernel is used instead
+    HAS_NUMBA = False
+
+# Julian date of the J2000.0 epoch and Unix epoch
+J2000_JD = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+# Annual general precession rates (Meeus, ch. 21), in radians per Julian year. Plain
+# floats, so float32 star arrays are not promoted to float64
+_PRECESSION_M = float(np.radians(3.07496 * 15.0 / 3600.0))
+_PRECESSION_N = float(np.radians(1.33621 * 15.0 / 3600.0))
+
+def gmst_radians(jd_ut1: float) -> float:
+    """Greenwich mean sidereal time (Meeus eq. 12.4) for a UT1 Julian date, in radians"""
+    d = jd_ut1 - J2000_JD
+    t = d / 36525.0
+    degrees = 280.46061837 + 360.98564736629 * d + t * t * (0.000387933 - t / 38710000.0)
+    return np.radians(degrees % 360.0)
+
+def precess_from_j2000(ra_rad: np.ndarray, dec_rad: np.ndarray, jd: float):
+    """Shift J2000 RA/Dec (radians) to the mean equinox of date with the annual-rate approximation"""
+    years = (jd - J2000_JD) / 365.25
+    delta_ra = (_PRECESSION_M + _PRECESSION_N * np.sin(ra_rad) * np.tan(dec_rad)) * years
+    delta_dec = _PRECESSION_N * np.cos(ra_rad) * years
+    return ra_rad + delta_ra, dec_rad + delta_dec
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def radec_to_altaz(ra, sin_dec, cos_dec, lst, sin_phi, cos_phi, min_sin_alt, out_alt, out_az):
+        """Equatorial to horizontal transform, writing radians into out_alt/out_az
+        
+        Stars whose sin(altitude) is at or below min_sin_alt get an altitude of -pi/2
+        and no azimuth.
+        """
+        for i in prange(ra.shape[0]):
+            hour_angle = lst - ra[i]
+            cos_h = np.cos(hour_angle)
+            sin_alt = sin_phi * sin_dec[i] + cos_phi * cos_dec[i] * cos_h
+            if sin_alt <= min_sin_alt:
+                # Below the cutoff: flag with the nadir and skip the rest
+                out_alt[i] = -np.pi / 2
+                continue
+            # fastmath may push the sine a hair past 1, so clamp before arcsin
+            out_alt[i] = np.arcsin(min(sin_alt, 1.0))
+            out_az[i] = np.pi + np.arctan2(np.sin(hour_angle) * cos_dec[i],
+                                           cos_h * sin_phi * cos_dec[i] - sin_dec[i] * cos_phi)
+else:
+    def radec_to_altaz(ra, sin_dec, cos_dec, lst, sin_phi, cos_phi, min_sin_alt, out_alt, out_az):
+        """Equatorial to horizontal transform, writing radians into out_alt/out_az
+        
+        Stars whose sin(altitude) is at or below min_sin_alt get an altitude of -pi/2.
+        """
+        # Plain floats keep float32 star arrays in float32
+        sin_phi, cos_phi = float(sin_phi), float(cos_phi)
+        hour_angle = float(lst) - ra
+        cos_h = np.cos(hour_angle)
+        sin_alt = sin_phi * sin_dec + cos_phi * cos_dec * cos_h
+        np.arcsin(np.clip(sin_alt, -1.0, 1.0), out=out_alt)
+        np.arctan2(np.sin(hour_angle) * cos_dec, cos_h * sin_phi * cos_dec - sin_dec * cos_phi, out=out_az)
+        out_az += np.pi
+        out_alt[sin_alt <= min_sin_alt] = -np.pi / 2
+
+def warm_up():
+    """Compile the kernel now so the first fast-mode redraw does not pay the JIT latency"""
+    # The star arrays are float32, which Numba compiles as its own specialization
+    zeros = np.zeros(1, dtype=np.float32)
+    radec_to_altaz(zeros, zeros, zeros, 0.0, 0.0, 1.0, -1.0,
+                   np.empty(1, dtype=np.float32), np.empty(1, dtype=np.float32))
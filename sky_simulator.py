@@ -3,77 +3,344 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.projections import PolarAxes
 from datetime import datetime, timedelta, timezone as dt_timezone
-from skyfield.api import Star, load, Topos
+from skyfield.api import load
 from skyfield.data import hipparcos
 from typing import Tuple, Optional
-import warnings
-warnings.filterwarnings('ignore')
+import contextlib
+import functools
+import os
+import tempfile
+import zipfile
+from sky_kernels import HAS_NUMBA, radec_to_altaz
+
+# Nutation and precession move stars by well under an arcsecond per day, so
+# they are evaluated once per TT day and shared by every frame in that day
+_ORIENTATION_BUCKET_DAYS = 1.0
+
+def _orientation_bucket(tt_jd: float) -> float:
+    """Round a TT Julian date to the earth-orientation cache bucket"""
+    return round(tt_jd / _ORIENTATION_BUCKET_DAYS) * _ORIENTATION_BUCKET_DAYS
+
+@functools.lru_cache(maxsize=4096)
+def _earth_orientation(ts, tt_bucket: float) -> Tuple[float, np.ndarray]:
+    """Equation of the equinoxes (radians) and ICRS-to-date rotation matrix for a bucket"""
+    t = ts.tt_jd(tt_bucket)
+    equation_of_equinoxes = ((t.gast - t.gmst + 12.0) % 24.0 - 12.0) * (np.pi / 12.0)
+    return equation_of_equinoxes, t.M
+
+# Sidereal turns per solar day, and the longest frame span over which GAST is interpolated
+_SIDEREAL_RATE = 1.00273781191135448
+_SIDEREAL_INTERPOLATION_MAX_DAYS = 1.0
+
+# Upper bound on frames x stars transformed in one broadcast block
+_FRAME_BLOCK_ELEMENTS = 1 << 20
+
+# Precomputed catalog arrays are cached here; SkySimulator keeps one file per magnitude limit
+_CATALOG_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sky_simulator')
+
+# Bump when the arrays SkySimulator caches change, so older cache files are rebuilt
+_CATALOG_CACHE_VERSION = 1
+
+def catalog_cache_path(file_name: str) -> str:
+    """Path of a file in the precomputed catalog cache directory"""
+    return os.path.join(_CATALOG_CACHE_DIR, file_name)
+
+def save_catalog_cache(path: str, version: int, **arrays):
+    """Write arrays and a format version to an .npz cache file; the cache is skipped if it cannot be written"""
+    # Write to a uniquely named temporary file first so an interrupted run never leaves a
+    # truncated cache and concurrent runs never write the same file. The cache is only an
+    # optimization, so an unwritable cache directory is not an error
+    directory = os.path.dirname(path)
+    temp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as f:
+            temp_path = f.name
+            np.savez(f, version=version, **arrays)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"Could not write catalog cache {path}: {e}")
+        if temp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+
+def load_catalog_cache(path: str, version: int, *names: str) -> Optional[Tuple[np.ndarray, ...]]:
+    """Read the named arrays from an .npz cache file
+    
+    Returns None when the file is missing, unreadable, incomplete or written with a
+    different format version, so the caller rebuilds it from the catalog.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            if int(data['version']) != version:
+                return None
+            return tuple(data[name] for name in names)
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+        print(f"Ignoring unreadable catalog cache {path}: {e}")
+        return None
+
+# Compass direction ticks (N, E, S, W) shared by every sky chart
+_XTICKS_RAD = np.radians([0, 90, 180, 270])
+
+def style_polar_axes(ax, *, title: Optional[str] = None, fontsize: Optional[float] = None,
+                     title_fontsize: float = 14, title_pad: Optional[float] = 20):
+    """Apply the sky-chart styling (north up, clockwise, altitude rings, compass ticks)"""
+    ax.set_theta_zero_location('N')  # type: ignore
+    ax.set_theta_direction(-1)        # type: ignore       # Clockwise
+    # Set radius from center (90° at center, 0° at edge)
+    ax.set_ylim(0, 90)
+    ax.set_yticks([0, 30, 60, 90])
+    ax.set_yticklabels(['90°', '60°', '30°', '0°'])
+    
+    # Configure grid and labels
+    ax.grid(True, alpha=0.3)
+    ax.set_facecolor('black')
+    
+    # Add compass directions
+    ax.set_xticks(_XTICKS_RAD)
+    ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white', fontsize=fontsize)
+    if fontsize is None:
+        ax.tick_params(colors='white')
+    else:
+        ax.tick_params(colors='white', labelsize=fontsize)
+    
+    if title is not None:
+        ax.set_title(title, color='white', fontsize=title_fontsize, pad=title_pad)
 
 class SkySimulator:
     def __init__(self):
-        self.load_planets = load('de421.bsp')
-        self.earth = self.load_planets['earth']
         self.ts = load.timescale()
-        self.stars_df = None
-        self.observer_location = None
+        self._sizes_all = None
+        self._ra_rad = None
+        self._dec_rad = None
+        self._sin_dec = None
+        self._cos_dec = None
+        self._date_catalog = (None, None)
         self.observer_coords = None
         
     def load_star_catalog(self, max_magnitude: float = 6.0):
         """Load Hipparcos star catalog with magnitude filter"""
+        cache_path = catalog_cache_path(f'hipparcos_m{max_magnitude}.npz')
+        cached = load_catalog_cache(cache_path, _CATALOG_CACHE_VERSION,
+                                    'ra_rad', 'dec_rad', 'sin_dec', 'cos_dec', 'sizes')
+        if cached is not None:
+            # Reuse the precomputed arrays; no catalog parsing is needed
+            self._ra_rad, self._dec_rad, self._sin_dec, self._cos_dec, self._sizes_all = cached
+            self._date_catalog = (None, None)
+            self._warm_up_kernel()
+            print(f"Loaded {len(self._ra_rad)} stars with magnitude <= {max_magnitude} (cached)")
+            return
+        
         with load.open(hipparcos.URL) as f:
-            self.stars_df = hipparcos.load_dataframe(f)
+            stars = hipparcos.load_dataframe(f)
         
         # Filter by magnitude (brightness)
-        self.stars_df = self.stars_df[self.stars_df['magnitude'] <= max_magnitude]
-        print(f"Loaded {len(self.stars_df)} stars with magnitude <= {max_magnitude}")
+        stars = stars[stars['magnitude'] <= max_magnitude]
+        
+        # Keep only the NumPy arrays the transform needs; the DataFrame is not retained.
+        # Plot-only positions need far less than FP64 precision, so keep them as FP32
+        self._ra_rad = np.radians(stars['ra_hours'].values * 15.0).astype(np.float32)
+        self._dec_rad = np.radians(stars['dec_degrees'].values).astype(np.float32)
+        self._sin_dec = np.sin(self._dec_rad)
+        self._cos_dec = np.cos(self._dec_rad)
+        self._date_catalog = (None, None)
+        
+        # Convert magnitude to point size once (brighter = larger)
+        self._sizes_all = np.clip(20 * (5 - stars['magnitude'].values) + 1, 1, 50).astype(np.float32)
+        
+        save_catalog_cache(cache_path, _CATALOG_CACHE_VERSION, ra_rad=self._ra_rad, dec_rad=self._dec_rad,
+                           sin_dec=self._sin_dec, cos_dec=self._cos_dec, sizes=self._sizes_all)
+        
+        self._warm_up_kernel()
+        print(f"Loaded {len(self._ra_rad)} stars with magnitude <= {max_magnitude}")
+        
+    def _warm_up_kernel(self):
+        """Compile the JIT kernel now so the first frame does not pay the compile latency"""
+        if HAS_NUMBA:
+            one = np.float32(1.0)
+            zero = np.float32(0.0)
+            radec_to_altaz(self._ra_rad[:1], self._sin_dec[:1], self._cos_dec[:1], zero,
+                           zero, one, 0.0, np.empty(1, np.float32), np.empty(1, np.float32))
         
     def set_observer_location(self, latitude: float, longitude: float, elevation: float = 0):
-        """Set observer location on Earth"""
-        self.observer_location = self.earth + Topos(latitude_degrees=latitude, 
-                                                   longitude_degrees=longitude,
-                                                   elevation_m=elevation)
-        self.observer_coords = (latitude, longitude)
+        """Set observer location on Earth
         
-    def get_star_positions(self, time: datetime, timezone: str = 'UTC') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Calculate star positions for given time with timezone handling"""
-        if self.stars_df is None or self.observer_location is None:
-            raise ValueError("Must load star catalog and set observer location first")
+        elevation is ignored: the closed-form transform only needs latitude and longitude.
+        It is still accepted so existing callers keep working.
+        """
+        self.observer_coords = (latitude, longitude)
         
-        # Handle timezone - assume naive datetime is UTC for simplicity
+    def _apparent_sidereal_time(self, t):
+        """Greenwich apparent sidereal time at t (scalar or array Time), in radians"""
+        # GMST is a cheap polynomial; only the nutation term comes from the cache
+        tt = np.atleast_1d(t.tt)
+        equation_of_equinoxes = np.array([_earth_orientation(self.ts, _orientation_bucket(jd))[0]
+                                          for jd in tt])
+        return t.gmst * (np.pi / 12.0) + equation_of_equinoxes.reshape(np.shape(t.tt))
+        
+    def _catalog_of_date(self, tt_jd: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Catalog RA and sin/cos Dec referred to the true equator and equinox of date"""
+        bucket = _orientation_bucket(tt_jd)
+        key, catalog = self._date_catalog
+        if key == bucket:
+            return catalog
+        
+        # Rotate the catalog unit vectors by the cached precession-nutation matrix
+        _, rotation = _earth_orientation(self.ts, bucket)
+        x, y, z = rotation.astype(np.float32) @ np.array([self._cos_dec * np.cos(self._ra_rad),
+                                       self._cos_dec * np.sin(self._ra_rad),
+                                       self._sin_dec])
+        catalog = (np.arctan2(y, x), z, np.hypot(x, y))
+        self._date_catalog = (bucket, catalog)
+        return catalog
+        
+    def _to_skyfield_time(self, time: datetime):
+        """Convert a datetime to a Skyfield Time, treating naive datetimes as UTC"""
         if time.tzinfo is None:
             time = time.replace(tzinfo=dt_timezone.utc)
+        return self.ts.from_datetime(time)
+        
+    def _skyfield_times(self, times):
+        """Build one array-valued Skyfield Time for a sequence of datetimes"""
+        # Naive datetimes are assumed to be UTC
+        return self.ts.from_datetimes([time if time.tzinfo is not None else time.replace(tzinfo=dt_timezone.utc)
+                                       for time in times])
+        
+    def _frame_sidereal_times(self, times) -> Tuple[np.ndarray, np.ndarray]:
+        """TT Julian dates and apparent sidereal times (radians) for evenly spaced frame times"""
+        if not times:
+            return np.array([]), np.array([])
+        
+        span_days = (times[-1] - times[0]).total_seconds() / 86400.0
+        if len(times) < 3 or span_days > _SIDEREAL_INTERPOLATION_MAX_DAYS:
+            # Long spans: evaluate every frame in a single Skyfield call
+            frame_times = self._skyfield_times(times)
+            return np.atleast_1d(frame_times.tt), np.atleast_1d(self._apparent_sidereal_time(frame_times))
+        
+        # Over short spans GAST is linear in time to well below plotting precision,
+        # so evaluate only the end points and interpolate the frames in between
+        ends = self._skyfield_times([times[0], times[-1]])
+        tt_start, tt_end = ends.tt
+        gast_start, gast_end = self._apparent_sidereal_time(ends)
+        
+        # GAST wraps at 2*pi; add back the whole turns implied by the elapsed time
+        turn = 2.0 * np.pi
+        expected = turn * _SIDEREAL_RATE * span_days
+        delta = gast_end - gast_start
+        delta += turn * np.round((expected - delta) / turn)
+        
+        fraction = np.linspace(0.0, 1.0, len(times))
+        return tt_start + (tt_end - tt_start) * fraction, gast_start + delta * fraction
+        
+    def _visible_stars(self, sidereal_time: float, tt_jd: float,
+                       observer_coords: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Transform the catalog to alt/az at a sidereal time (radians) and keep stars above horizon"""
+        if observer_coords is None:
+            observer_coords = self.observer_coords
+        if self._ra_rad is None or observer_coords is None:
+            raise ValueError("Must load star catalog and set observer location first")
         
-        # Convert to UTC for astronomical calculations
-        utc_time = time.astimezone(dt_timezone.utc)
-        t = self.ts.utc(utc_time.year, utc_time.month, utc_time.day, 
-                       utc_time.hour, utc_time.minute, utc_time.second)
-        observer = self.observer_location.at(t)
+        sin_phi, cos_phi, lon_rad = self._observer_terms(observer_coords)
+        if not HAS_NUMBA:
+            return self._visible_block(np.atleast_1d(sidereal_time), tt_jd, sin_phi, cos_phi, lon_rad)[0]
         
-        star_positions = []
-        star_magnitudes = []
+        ra, sin_dec, cos_dec = self._catalog_of_date(tt_jd)
+        gast_plus_lon = np.float32((sidereal_time + lon_rad) % (2.0 * np.pi))
+        alt = np.empty_like(ra)
+        az = np.empty_like(ra)
+        radec_to_altaz(ra, sin_dec, cos_dec, gast_plus_lon,
+                       sin_phi, cos_phi, 0.0, alt, az)
         
-        for _, star_data in self.stars_df.iterrows():
-            star = Star.from_dataframe(star_data)
-            astrometric = observer.observe(star)
-            
-            # Get altitude and azimuth
-            alt, az, _ = astrometric.apparent().altaz()
-            
-            # Only include stars above horizon
-            if alt.degrees > 0:
-                star_positions.append([az.degrees, alt.degrees])
-                star_magnitudes.append(star_data['magnitude'])
-        if not star_positions:
+        # Only include stars above horizon (the kernel leaves azimuth unset below it)
+        above = alt > 0
+        if not above.any():
             return np.array([]), np.array([]), np.array([])
-            
-        positions = np.array(star_positions)
-        magnitudes = np.array(star_magnitudes)
         
-        # Convert magnitude to point size (brighter = larger)
-        sizes = 20 * (5 - magnitudes) + 1
-        sizes = np.clip(sizes, 1, 50)
+        return np.degrees(az[above]) % 360.0, np.degrees(alt[above]), self._sizes_all[above]
         
-        return positions[:, 0], positions[:, 1], sizes
+    def _visible_stars_frames(self, sidereal_times: np.ndarray, frame_tt: np.ndarray):
+        """Visible (az, alt, sizes) for every frame, transforming blocks of frames at once"""
+        if self._ra_rad is None or self.observer_coords is None:
+            raise ValueError("Must load star catalog and set observer location first")
+        
+        # The compiled kernel is already a tight per-star loop; batching only helps NumPy
+        if HAS_NUMBA:
+            return [self._visible_stars(sidereal_time, tt_jd)
+                    for sidereal_time, tt_jd in zip(sidereal_times, frame_tt)]
+        
+        sin_phi, cos_phi, lon_rad = self._observer_terms(self.observer_coords)
+        frames_per_block = max(1, _FRAME_BLOCK_ELEMENTS // max(len(self._ra_rad), 1))
+        buckets = [_orientation_bucket(tt_jd) for tt_jd in frame_tt]
+        
+        # A block shares one catalog of date, so it ends where the orientation bucket changes
+        results = []
+        start = 0
+        while start < len(buckets):
+            stop = start + 1
+            while (stop < len(buckets) and stop - start < frames_per_block
+                   and buckets[stop] == buckets[start]):
+                stop += 1
+            results.extend(self._visible_block(sidereal_times[start:stop], frame_tt[start],
+                                               sin_phi, cos_phi, lon_rad))
+            start = stop
+        return results
+        
+    @staticmethod
+    def _observer_terms(observer_coords: Tuple[float, float]) -> Tuple[np.float32, np.float32, float]:
+        """sin/cos of the observer latitude (FP32) and longitude in radians"""
+        # Observer terms are FP32 scalars so the whole transform stays in single precision;
+        # GAST is only rounded after adding the longitude, so no precision is lost upstream
+        lat, lon = observer_coords
+        phi = np.radians(lat)
+        return np.float32(np.sin(phi)), np.float32(np.cos(phi)), np.radians(lon)
+        
+    def _visible_block(self, sidereal_times: np.ndarray, tt_jd: float, sin_phi: np.float32,
+                       cos_phi: np.float32, lon_rad: float):
+        """NumPy transform of a block of frames that share one catalog of date"""
+        ra, sin_dec, cos_dec = self._catalog_of_date(tt_jd)
+        
+        # Stars with |latitude - dec| >= 90 deg never rise, i.e. cos(latitude - dec) <= 0
+        candidates = np.flatnonzero(cos_phi * cos_dec + sin_phi * sin_dec > 0)
+        ra, sin_dec, cos_dec = ra[candidates], sin_dec[candidates], cos_dec[candidates]
+        
+        # Convert equatorial to horizontal coordinates in closed form, broadcasting frames
+        # (rows) against stars (columns): H[i, j] = GAST[i] + longitude - RA[j]
+        gast_plus_lon = ((np.asarray(sidereal_times) + lon_rad) % (2.0 * np.pi)).astype(np.float32)
+        hour_angle = gast_plus_lon[:, np.newaxis] - ra
+        cos_h = np.cos(hour_angle)
+        sin_alt = sin_phi * sin_dec + cos_phi * cos_dec * cos_h
+        
+        # Only include stars above horizon; arcsin/atan2 run on that subset only
+        above = sin_alt > 0
+        _, star = np.nonzero(above)
+        hour_angle, cos_h = hour_angle[above], cos_h[above]
+        sin_dec, cos_dec = sin_dec[star], cos_dec[star]
+        alt = np.arcsin(sin_alt[above])
+        az = np.pi + np.arctan2(np.sin(hour_angle) * cos_dec,
+                                cos_h * sin_phi * cos_dec - sin_dec * cos_phi)
+        
+        # Split the flattened (row-major) results back into one entry per frame
+        splits = np.cumsum(np.count_nonzero(above, axis=1))[:-1]
+        return list(zip(np.split(np.degrees(az) % 360.0, splits),
+                        np.split(np.degrees(alt), splits),
+                        np.split(self._sizes_all[candidates[star]], splits)))
+        
+    def get_star_positions(self, time: datetime, timezone: str = 'UTC', latitude: Optional[float] = None,
+                           longitude: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate star positions for given time with timezone handling
+        
+        Passing latitude and longitude evaluates the sky for that location without touching
+        the simulator's observer, so one simulator can be shared between threads.
+        """
+        if (latitude is None) != (longitude is None):
+            raise ValueError("Pass both latitude and longitude, or neither")
+        
+        # Naive datetimes are assumed to be UTC
+        t = self._to_skyfield_time(time)
+        observer_coords = (latitude, longitude) if latitude is not None else None
+        return self._visible_stars(self._apparent_sidereal_time(t), t.tt, observer_coords)
         
     def plot_sky(self, time: datetime, save_path: Optional[str] = None, timezone: str = 'UTC'):
         """Create a polar plot of the sky at given time"""
@@ -93,24 +360,8 @@ class SkySimulator:
         # Plot stars
         ax.scatter(az_rad, 90 - alt, s=sizes, c='white', alpha=0.8)
         
-        # Customize plot - using type comment for polar axes methods
-        ax.set_theta_zero_location('N')  # type: ignore
-        ax.set_theta_direction(-1)        # type: ignore       # Clockwise
-        # Set radius from center (90° at center, 0° at edge)
-        ax.set_ylim(0, 90)
-        ax.set_yticks([0, 30, 60, 90])
-        ax.set_yticklabels(['90°', '60°', '30°', '0°'])
-        
-        # Configure grid and labels
-        ax.grid(True, alpha=0.3)
-        ax.set_facecolor('black')
         fig.patch.set_facecolor('black')
         
-        # Add compass directions
-        ax.set_xticks(np.radians([0, 90, 180, 270]))
-        ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white')
-        ax.tick_params(colors='white')
-        
         # Add title with time and location info
         if self.observer_coords is not None:
             lat, lon = self.observer_coords
@@ -119,7 +370,7 @@ class SkySimulator:
         else:
             title = f'Sky View - {time.strftime("%Y-%m-%d %H:%M")}\nLocation: Unknown'
         
-        ax.set_title(title, color='white', fontsize=14, pad=20)
+        style_polar_axes(ax, title=title)
         # Create legend with magnitude examples
         mag_examples = [1, 3, 5]  # Example magnitudes
         for mag in mag_examples:
@@ -145,15 +396,12 @@ class SkySimulator:
         
         # Create figure with polar projection
         fig, ax = plt.subplots(figsize=(12, 12), subplot_kw=dict(projection='polar'))  # type: ignore
-        ax.set_theta_zero_location('N')  # North at top  # type: ignore
-        ax.set_theta_direction(-1)       # Clockwise  # type: ignore
-        ax.set_ylim(0, 90)
-        ax.set_facecolor('black')
         fig.patch.set_facecolor('black')
         
+        frame_tt, sidereal_times = self._frame_sidereal_times(times)
+        
         # Plot star trails
-        for i, time in enumerate(times):
-            az, alt, sizes = self.get_star_positions(time, timezone)
+        for i, (az, alt, sizes) in enumerate(self._visible_stars_frames(sidereal_times, frame_tt)):
             if len(az) > 0:
                 az_rad = np.radians(az)
                 alpha = 0.1 + 0.9 * (i / num_frames)  # Fade in effect
@@ -161,12 +409,6 @@ class SkySimulator:
             elif i == 0:  # Only warn once if first frame has no stars
                 print("Warning: No stars visible at start time")
         
-        # Configure plot
-        ax.grid(True, alpha=0.3)
-        ax.set_xticks(np.radians([0, 90, 180, 270]))
-        ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white')
-        ax.tick_params(colors='white')
-        
         # Add title
         if self.observer_coords is not None:
             lat, lon = self.observer_coords
@@ -175,7 +417,7 @@ class SkySimulator:
             title += f'Location: {lat:.1f}°N, {lon:.1f}°W'
         else:
             title = f'Star Trails - {duration_hours:.1f} hours\nStart: {start_time.strftime("%Y-%m-%d %H:%M")}\nLocation: Unknown'
-        ax.set_title(title, color='white', fontsize=14, pad=20)
+        style_polar_axes(ax, title=title)
         
         plt.tight_layout()
         
@@ -188,45 +430,34 @@ class SkySimulator:
                    interval_minutes: float = 10, save_path: Optional[str] = None, timezone: str = 'UTC'):
         """Create animated visualization of sky over time"""
         num_frames = int(duration_hours * 60 / interval_minutes)
+        times = [start_time + timedelta(minutes=i * interval_minutes) 
+                for i in range(num_frames)]
+        
+        frame_tt, sidereal_times = self._frame_sidereal_times(times)
+        frames = self._visible_stars_frames(sidereal_times, frame_tt)
         
         fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))  # type: ignore
-        ax.set_theta_zero_location('N')  # type: ignore
-        ax.set_theta_direction(-1)  # type: ignore
-        ax.set_ylim(0, 90)
-        ax.set_facecolor('black')
+        style_polar_axes(ax)
         fig.patch.set_facecolor('black')
         
+        # Create the artists once; each frame only updates their data
+        scatter = ax.scatter([], [], s=[], c='white', alpha=0.8)
+        title_text = ax.set_title('', color='white', fontsize=12, pad=20)
+        if self.observer_coords is not None:
+            lat, lon = self.observer_coords
+            location = f'Location: {lat:.1f}°N, {lon:.1f}°W'
+        else:
+            location = 'Location: Unknown'
+        
         def animate(frame):
-            ax.clear()
-            
-            current_time = start_time + timedelta(minutes=frame * interval_minutes)
-            az, alt, sizes = self.get_star_positions(current_time, timezone)
-            
-            if len(az) > 0:
-                az_rad = np.radians(az)
-                ax.scatter(az_rad, 90 - alt, s=sizes, c='white', alpha=0.8)
-            
-            ax.set_theta_zero_location('N')   # North at top  # type: ignore
-            ax.set_theta_direction(-1)        # Clockwise  # type: ignore
-            ax.set_ylim(0, 90)
-            ax.set_yticks([0, 30, 60, 90])
-            ax.set_yticklabels(['90°', '60°', '30°', '0°'])
-            ax.grid(True, alpha=0.3)
-            ax.set_facecolor('black')
-            ax.set_xticks(np.radians([0, 90, 180, 270]))
-            ax.set_xticklabels(['N', 'E', 'S', 'W'], color='white')
-            ax.tick_params(colors='white')
+            current_time = times[frame]
+            az, alt, sizes = frames[frame]
             
-            # Update title
-            if self.observer_coords is not None:
-                lat, lon = self.observer_coords
-                title = f'Sky Animation - {current_time.strftime("%Y-%m-%d %H:%M")}\n'
-                title += f'Location: {lat:.1f}°N, {lon:.1f}°W'
-            else:
-                title = f'Sky Animation - {current_time.strftime("%Y-%m-%d %H:%M")}\nLocation: Unknown'
-            ax.set_title(title, color='white', fontsize=12, pad=20)
+            scatter.set_offsets(np.column_stack([np.radians(az), 90 - alt]))
+            scatter.set_sizes(sizes)
+            title_text.set_text(f'Sky Animation - {current_time.strftime("%Y-%m-%d %H:%M")}\n{location}')
             
-            return []
+            return [scatter, title_text]
         
         anim = FuncAnimation(fig, animate, frames=num_frames, interval=200, blit=False)
         
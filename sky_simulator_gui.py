@@ -2,18 +2,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.colors import BoundaryNorm, ListedColormap
 from matplotlib.animation import FuncAnimation
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta, timezone as dt_timezone
 from skyfield.api import Star, load, Topos
 from skyfield.data import hipparcos
+from sky_kernels import UNIX_EPOCH_JD, gmst_radians, precess_from_j2000, radec_to_altaz, warm_up
+from sky_simulator import catalog_cache_path, load_catalog_cache, save_catalog_cache
 from typing import Tuple, Optional
 import warnings
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
 import time
-warnings.filterwarnings('ignore')
 
 class SkySimulatorGUI:
     def __init__(self, root):
@@ -27,6 +30,26 @@ class SkySimulatorGUI:
         self.current_time = datetime.now()
         self.animation_running = False
         self.animation = None
+        self._mag_after_id = None
+        self._background = None
+        # A single worker runs the Skyfield math in submission order, off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._sky_future = None
+        self._sky_request = 0
+        self._anim_future = None
+        self._anim_alt = None
+        self._anim_az = None
+        self._anim_sizes = None
+        self._anim_color_idx = None
+        self._anim_dalt = None
+        self._anim_daz = None
+        self._anim_step = None
+        self._interp_alt = None
+        self._interp_az = None
+        self._anim_location = ''
+        self._anim_keyframes = 0
+        self._anim_time = None
+        self._last_ui_update = 0.0
         
         # Default values
         self.latitude = 40.7128  # New York
@@ -95,6 +118,10 @@ class SkySimulatorGUI:
         self.mag_label = ttk.Label(display_frame, text=f"{self.max_magnitude:.1f}")
         self.mag_label.grid(row=0, column=2)
         
+        self.fast_mode_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(display_frame, text="Fast mode (approximate)", variable=self.fast_mode_var,
+                        command=self.toggle_fast_mode).grid(row=1, column=0, columnspan=3, sticky=tk.W)
+        
         # Action Buttons
         action_frame = ttk.LabelFrame(control_frame, text="Actions", padding="5")
         action_frame.pack(fill=tk.X, pady=(0, 10))
@@ -139,10 +166,13 @@ class SkySimulatorGUI:
         # Create matplotlib figure
         self.fig = Figure(figsize=(8, 8), facecolor='black')
         self.ax = self.fig.add_subplot(111, projection='polar')
+        # The chart is built once; updates only touch the star artists' data
         self.setup_plot()
+        self.create_star_artists()
         
-        # Create canvas
+        # Create canvas; every full draw re-captures the static chart for blitting
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -152,7 +182,7 @@ class SkySimulatorGUI:
         status_bar.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         
     def setup_plot(self):
-        """Setup the polar plot"""
+        """Setup the static polar chart: grid, ticks and legend"""
         self.ax.set_theta_zero_location('N')
         self.ax.set_theta_direction(-1)
         self.ax.set_ylim(0, 90)
@@ -181,6 +211,58 @@ class SkySimulatorGUI:
         self.ax.legend(loc='upper right', framealpha=0.8, labelcolor='white', 
                       fontsize=8, title='Star Magnitude', title_fontsize=9)
         
+    def create_star_artists(self):
+        """Create the artists whose data changes with time and location"""
+        # Redraws only update their data. They are animated so full draws leave
+        # them out of the captured background
+        self._scatter = self.ax.scatter([], [], s=[], c=[], alpha=0.9, edgecolors='white', linewidths=0.5,
+                                        cmap=_MAG_CMAP, norm=_MAG_NORM, animated=True)
+        self._no_stars_text = self.ax.text(0, 45, "No stars visible", ha='center', va='center', 
+                                           color='white', fontsize=14, visible=False, animated=True)
+        
+        # Blitting only refreshes the bounding boxes of the axes that own the updated
+        # artists, so the title lives in its own strip of axes above the chart
+        chart = self.ax.get_position()
+        self._title_ax = self.fig.add_axes([chart.x0, 0.895, chart.width, 0.105])
+        self._title_ax.set_axis_off()
+        self._title_artist = self._title_ax.text(0.5, 0.5, '', ha='center', va='baseline', 
+                                                 color='white', fontsize=12, animated=True)
+        
+    def show_stars(self, az, alt, sizes, color_idx):
+        """Point the persistent scatter artist at a new set of visible stars"""
+        if len(az) > 0:
+            az_rad = np.radians(az)
+            self._scatter.set_offsets(np.column_stack([az_rad, 90 - alt]))
+            # The collection keeps the sizes array and rescales it on every draw, so give
+            # it a copy rather than the simulator's reusable buffer
+            self._scatter.set_sizes(sizes.copy())
+            self._scatter.set_array(color_idx)
+        else:
+            self._scatter.set_offsets(np.empty((0, 2)))
+            self._scatter.set_array(np.empty(0, dtype=np.int8))
+        self._no_stars_text.set_visible(len(az) == 0)
+        
+    def _on_draw(self, event):
+        """Capture the static chart after a full draw and paint the dynamic artists over it"""
+        if self.animation is not None:
+            return  # FuncAnimation keeps its own background while it runs
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_dynamic_artists()
+        
+    def _draw_dynamic_artists(self):
+        """Render only the artists that change between updates"""
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+        
+    def _blit_stars(self):
+        """Refresh the dynamic artists on top of the saved chart background"""
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_dynamic_artists()
+        self.canvas.blit(self.fig.bbox)
+        
     def initialize_simulator(self):
         """Initialize the sky simulator with default settings"""
         try:
@@ -195,20 +277,29 @@ class SkySimulatorGUI:
             self.status_var.set("Error")
             
     def update_magnitude(self, value):
-        """Update magnitude label and reload stars"""
+        """Update magnitude label and schedule a star update once the slider settles"""
         mag = float(value)
         self.mag_label.config(text=f"{mag:.1f}")
         
-        if hasattr(self, 'simulator') and self.simulator.stars_df is not None:
-            try:
-                self.status_var.set("Reloading star catalog...")
-                self.root.update()
-                self.simulator.load_star_catalog(max_magnitude=mag)
-                self.update_sky()
-                self.status_var.set("Ready")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update magnitude: {str(e)}")
+        # The Scale fires on every pixel of a drag; only update after 200 ms of quiet
+        if self._mag_after_id is not None:
+            self.root.after_cancel(self._mag_after_id)
+        self._mag_after_id = self.root.after(200, self._do_update_magnitude, mag)
+        
+    def _do_update_magnitude(self, mag):
+        """Re-filter stars for the settled slider magnitude"""
+        self._mag_after_id = None
+        if hasattr(self, 'simulator') and self.simulator.catalog_loaded:
+            # The catalog is already in memory, so this is only a mask; update_sky applies
+            # it on the worker so it never changes the arrays under a computation
+            self.max_magnitude = mag
+            self.update_sky()
                 
+    def toggle_fast_mode(self):
+        """Switch between the Skyfield pipeline and the approximate kernel"""
+        # update_sky hands the checkbox state to the worker with the other settings
+        self.update_sky()
+        
     def use_current_time(self):
         """Set time controls to current time"""
         now = datetime.now()
@@ -245,36 +336,61 @@ class SkySimulatorGUI:
             self.latitude = float(self.lat_var.get())
             self.longitude = float(self.lon_var.get())
             current_time = self.parse_time()
-            
-            # Update simulator
-            self.simulator.set_observer_location(self.latitude, self.longitude)
-            
-            # Get star positions
-            az, alt, sizes, colors = self.simulator.get_star_positions(current_time)
-            
-            # Clear and redraw
-            self.ax.clear()
-            self.setup_plot()
-            
-            if len(az) > 0:
-                az_rad = np.radians(az)
-                self.ax.scatter(az_rad, 90 - alt, s=sizes, c=colors, alpha=0.9, edgecolors='white', linewidths=0.5)
-            else:
-                self.ax.text(0, 45, "No stars visible", ha='center', va='center', 
-                           color='white', fontsize=14)
-            
-            # Update title
-            title = f'Sky View - {current_time.strftime("%Y-%m-%d %H:%M")}\n'
-            title += f'Location: {self.latitude:.1f}°N, {self.longitude:.1f}°W'
-            self.ax.set_title(title, color='white', fontsize=12, pad=20)
-            
-            self.canvas.draw()
-            self.status_var.set(f"Updated - {len(az)} stars visible")
-            
+        except Exception as e:
+            messagebox.showerror("Update Error", f"Failed to update sky: {str(e)}")
+            self.status_var.set("Error")
+            return
+        
+        # Drop a queued update that has not started; only the newest request is drawn
+        if self._sky_future is not None:
+            self._sky_future.cancel()
+        self._sky_request += 1
+        self._sky_future = self._executor.submit(self._compute_sky, self.latitude, self.longitude,
+                                                 current_time, self.fast_mode_var.get(), self.max_magnitude)
+        # During an animation the update only applies the settings; the frames own the chart
+        if not self.animation_running:
+            self.status_var.set("Updating...")
+        self.root.after(10, self._poll_sky_result, self._sky_request, self._sky_future, current_time)
+        
+    def _compute_sky(self, latitude, longitude, current_time, fast_mode, max_magnitude):
+        """Worker-thread half of update_sky: apply the settings and compute star positions"""
+        # Every update carries the slider value, so a cancelled update never loses a change
+        if max_magnitude != self.simulator.max_magnitude:
+            self.simulator.set_magnitude_limit(max_magnitude)
+        self.simulator.fast_mode = fast_mode
+        self.simulator.set_observer_location(latitude, longitude)
+        return self.simulator.get_star_positions(current_time)
+        
+    def _poll_sky_result(self, request_id, future, current_time):
+        """Wait on the Tk thread for a sky update; Tk must not be touched from the worker"""
+        if not future.done():
+            self.root.after(10, self._poll_sky_result, request_id, future, current_time)
+            return
+        if request_id != self._sky_request or future.cancelled():
+            return  # A newer update_sky superseded this one
+        if self.animation_running:
+            return  # Drawing it would overwrite the animation's frame and status
+        try:
+            self._apply_sky_result(current_time, future.result())
         except Exception as e:
             messagebox.showerror("Update Error", f"Failed to update sky: {str(e)}")
             self.status_var.set("Error")
             
+    def _apply_sky_result(self, current_time, result):
+        """Draw the star positions computed by _compute_sky"""
+        az, alt, sizes, color_idx = result
+        
+        # Update the existing artists instead of rebuilding the chart
+        self.show_stars(az, alt, sizes, color_idx)
+        
+        # Update title
+        title = f'Sky View - {current_time.strftime("%Y-%m-%d %H:%M")}\n'
+        title += f'Location: {self.latitude:.1f}°N, {self.longitude:.1f}°W'
+        self._title_artist.set_text(title)
+        
+        self._blit_stars()
+        self.status_var.set(f"Updated - {len(az)} stars visible")
+        
     def save_image(self):
         """Save current plot to file"""
         try:
@@ -283,7 +399,14 @@ class SkySimulatorGUI:
                 filetypes=[("PNG files", "*.png"), ("All files", "*.*")]
             )
             if filename:
-                self.fig.savefig(filename, facecolor='black', dpi=150, bbox_inches='tight')
+                # savefig skips animated artists, so include them for the saved image
+                for artist in self._animated_artists():
+                    artist.set_animated(False)
+                try:
+                    self.fig.savefig(filename, facecolor='black', dpi=150, bbox_inches='tight')
+                finally:
+                    for artist in self._animated_artists():
+                        artist.set_animated(True)
                 messagebox.showinfo("Success", f"Image saved to {filename}")
                 self.status_var.set(f"Saved to {os.path.basename(filename)}")
         except Exception as e:
@@ -303,26 +426,74 @@ class SkySimulatorGUI:
             interval = float(self.interval_var.get())
             start_time = self.parse_time()
             
+            # Calculate number of frames
+            if interval <= 0:
+                raise ValueError("Interval (min) must be positive")
+            num_frames = int(duration * 60 / interval)
+            if num_frames < 1:
+                raise ValueError("Duration (hours) must be at least one interval long")
+            
             self.animation_running = True
             self.animate_button.config(text="Stop Animation")
-            self.status_var.set("Animation running...")
+            self.status_var.set("Preparing animation...")
             
-            # Calculate number of frames
-            num_frames = int(duration * 60 / interval)
             self.animation_times = [start_time + timedelta(minutes=i * interval) 
                                    for i in range(num_frames)]
             
-            # Create matplotlib animation
+            # A sky update still in flight would draw over the animation; drop its result
+            if self._sky_future is not None:
+                self._sky_future.cancel()
+            self._sky_request += 1
+            
+            # Compute every keyframe up front; frames then only index these (frames, stars) arrays.
+            # It runs on the worker, after any pending sky update, so the two never overlap
+            self._anim_future = self._executor.submit(self.simulator.get_star_positions_series,
+                                                      self.animation_times)
+            self.root.after(10, self._poll_animation_keyframes, self._anim_future, interval)
+            
+        except Exception as e:
+            messagebox.showerror("Animation Error", f"Failed to start animation: {str(e)}")
+            self.stop_animation()
+            
+    def _poll_animation_keyframes(self, future, interval):
+        """Wait on the Tk thread for the keyframes, then start playback"""
+        if not future.done():
+            self.root.after(10, self._poll_animation_keyframes, future, interval)
+            return
+        if future is not self._anim_future or future.cancelled() or not self.animation_running:
+            return  # Stopped, or restarted, while the keyframes were computed
+        try:
+            # The frames keep their own sizes and colors because a magnitude change during
+            # the animation swaps the simulator's selection
+            self._anim_alt, self._anim_az, self._anim_sizes, self._anim_color_idx = future.result()
+            self._anim_location = f'Location: {self.latitude:.1f}°N, {self.longitude:.1f}°W'
+            self._anim_keyframes = len(self.animation_times)
+            
+            # Display frames between keyframes are linear blends; over one time step the
+            # sky moves a few degrees, so the chart cannot tell them from computed frames.
+            # Azimuth steps take the short way round through north
+            self._anim_step = timedelta(minutes=interval)
+            self._anim_dalt = np.diff(self._anim_alt, axis=0)
+            self._anim_daz = (np.diff(self._anim_az, axis=0) + 180.0) % 360.0 - 180.0
+            self._interp_alt = np.empty_like(self._anim_alt[0])
+            self._interp_az = np.empty_like(self._anim_az[0])
+            display_frames = (self._anim_keyframes - 1) * _ANIM_SUBSTEPS + 1
+            
+            # Create matplotlib animation; blitting redraws only the returned artists
             self.animation = FuncAnimation(
                 self.fig, 
                 self.update_animation_frame,
-                frames=num_frames,
-                interval=100,  # 100ms per frame (10 FPS for smooth animation)
+                frames=display_frames,
+                interval=_ANIM_FRAME_MS,
                 repeat=True,
-                blit=False
+                blit=True
             )
+            self.status_var.set("Animation running...")
             
-            self.canvas.draw()
+            # FuncAnimation starts on the next draw; let Tk fold it into its idle redraw
+            # rather than forcing one here
+            self._last_ui_update = 0.0
+            self.canvas.draw_idle()
             
         except Exception as e:
             messagebox.showerror("Animation Error", f"Failed to start animation: {str(e)}")
@@ -334,46 +505,65 @@ class SkySimulatorGUI:
         if self.animation:
             self.animation.event_source.stop()
             self.animation = None
+            
+            # Frames only refresh the time fields periodically; leave them on the last frame shown
+            if self._anim_time is not None:
+                self.date_var.set(self._anim_time.strftime("%Y-%m-%d"))
+                self.time_var.set(self._anim_time.strftime("%H:%M"))
+            
+            # The next draw re-captures the background and repaints the last frame on it
+            self.canvas.draw_idle()
         self.animate_button.config(text="Start Animation")
         self.status_var.set("Animation stopped")
         
+    def _animated_artists(self):
+        """Artists that change between animation frames"""
+        return [self._scatter, self._no_stars_text, self._title_artist]
+        
     def update_animation_frame(self, frame):
         """Update a single animation frame"""
         try:
             if not self.animation_running:
                 return []
                 
-            current_time = self.animation_times[frame]
+            keyframe, step = divmod(frame, _ANIM_SUBSTEPS)
+            fraction = step / _ANIM_SUBSTEPS
+            current_time = self.animation_times[keyframe] + fraction * self._anim_step
+            self._anim_time = current_time
             
-            # Update time display
-            self.date_var.set(current_time.strftime("%Y-%m-%d"))
-            self.time_var.set(current_time.strftime("%H:%M"))
+            # Update time display at most once a second; each StringVar write fires
+            # Tk traces and an Entry redisplay
+            now = time.monotonic()
+            if now - self._last_ui_update > 1.0:
+                self._last_ui_update = now
+                self.date_var.set(current_time.strftime("%Y-%m-%d"))
+                self.time_var.set(current_time.strftime("%H:%M"))
             
-            # Get star positions
-            az, alt, sizes, colors = self.simulator.get_star_positions(current_time)
-            
-            # Clear and redraw
-            self.ax.clear()
-            self.setup_plot()
-            
-            if len(az) > 0:
-                az_rad = np.radians(az)
-                self.ax.scatter(az_rad, 90 - alt, s=sizes, c=colors, alpha=0.9, 
-                               edgecolors='white', linewidths=0.5)
+            # Get star positions from the precomputed keyframes, blending toward the next one
+            if step == 0:
+                star_alt, star_az = self._anim_alt[keyframe], self._anim_az[keyframe]
             else:
-                self.ax.text(0, 45, "No stars visible", ha='center', va='center', 
-                           color='white', fontsize=14)
+                star_alt = np.multiply(self._anim_dalt[keyframe], fraction, out=self._interp_alt)
+                star_alt += self._anim_alt[keyframe]
+                star_az = np.multiply(self._anim_daz[keyframe], fraction, out=self._interp_az)
+                star_az += self._anim_az[keyframe]
+                star_az %= 360.0
+            az, alt, sizes, color_idx = self.simulator.visible_stars(star_alt, star_az, sizes=self._anim_sizes,
+                                                                     color_idx=self._anim_color_idx)
+            
+            # Update the existing artists; FuncAnimation blits them onto the background
+            self.show_stars(az, alt, sizes, color_idx)
             
             # Update title
-            title = f'Sky Animation - {current_time.strftime("%Y-%m-%d %H:%M")}\n'
-            title += f'Location: {self.latitude:.1f}°N, {self.longitude:.1f}°W\n'
-            title += f'Frame {frame + 1}/{len(self.animation_times)}'
-            self.ax.set_title(title, color='white', fontsize=12, pad=20)
+            self._title_artist.set_text(f'Sky Animation - {current_time.strftime("%Y-%m-%d %H:%M")}\n'
+                                        f'{self._anim_location}\n'
+                                        f'Frame {keyframe + 1}/{self._anim_keyframes}')
             
-            self.canvas.draw_idle()  # More efficient than draw()
-            self.status_var.set(f"Animation - Frame {frame + 1}/{len(self.animation_times)}")
+            # The status only names the keyframe, so only rewrite it when that changes
+            if step == 0:
+                self.status_var.set(f"Animation - Frame {keyframe + 1}/{self._anim_keyframes}")
             
-            return []
+            return self._animated_artists()
             
         except Exception as e:
             self.status_var.set(f"Animation frame error: {str(e)}")
@@ -384,26 +574,171 @@ class SkySimulatorGUI:
         self.animation_running = False
         if self.animation:
             self.animation.event_source.stop()
+        if self._mag_after_id is not None:
+            self.root.after_cancel(self._mag_after_id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
         self.root.destroy()
 
 
+# Star color by magnitude (brightness/temperature): sky blue for very bright, blue/white
+# hot stars, then white, moccasin (like our sun), orange, and light red for cooler stars.
+# A magnitude equal to a bin edge falls in the dimmer class. Stars carry the integer
+# class index, which the scatter maps through this colormap
+_MAG_BINS = np.array([1.0, 2.0, 3.0, 4.0])
+_MAG_CMAP = ListedColormap(['#87CEEB', 'white', '#FFE4B5', '#FFA500', '#FF6B6B'])
+_MAG_NORM = BoundaryNorm(np.arange(_MAG_CMAP.N + 1), _MAG_CMAP.N)
+
+# Animation playback: display frames per computed keyframe, and the delay between
+# display frames. Keyframes still advance every 100 ms, as before interpolation
+_ANIM_SUBSTEPS = 4
+_ANIM_FRAME_MS = 25
+
+# Entries kept in each of the simulator's Time and observer-position caches
+_CACHE_SIZE = 64
+
+# The parsed Hipparcos columns are cached here so later starts skip the text parser
+_CATALOG_CACHE_PATH = catalog_cache_path('hipparcos_gui.npz')
+# Bump when the cached columns change, so older cache files are rebuilt
+_CATALOG_CACHE_VERSION = 2
+
+# Stars whose approximate altitude is below this never reach the full astrometry
+_CULL_MARGIN_RAD = np.radians(-1.0)
+_CULL_MARGIN_SIN = float(np.sin(_CULL_MARGIN_RAD))
+
 class SkySimulator:
     def __init__(self):
         self.load_planets = load('de421.bsp')
         self.earth = self.load_planets['earth']
         self.ts = load.timescale()
-        self.stars_df = None
+        
+        # The full catalog is parsed once; magnitude changes only re-select from it
+        self._catalog_loaded = False
+        self._all_ra_hours = None
+        self._all_dec_degrees = None
+        self._all_magnitudes = None
+        self._all_ra_mas_per_year = None
+        self._all_dec_mas_per_year = None
+        self._all_parallax_mas = None
+        self._all_epoch = None
+        
+        # Magnitude limit of the current selection
+        self.max_magnitude = None
+        
+        # Selected catalog columns as parallel NumPy arrays (structure of arrays)
+        self._ra_hours = None
+        self._dec_degrees = None
+        self._magnitudes = None
+        self._ra_mas_per_year = None
+        self._dec_mas_per_year = None
+        self._parallax_mas = None
+        self._epoch = None
+        self._sizes_all = None
+        self._color_idx_all = None
+        self._stars_vec = None
         self.observer_location = None
         self.observer_coords = None
+        self.observer_elevation = 0
+        
+        # Fast mode swaps Skyfield for closed-form sidereal time and simple precession;
+        # compile its kernel now rather than on the first redraw
+        self.fast_mode = False
+        self._ra_rad = None
+        self._dec_rad = None
+        # visible_stars writes into reusable output buffers. The sky worker and the
+        # animation (Tk thread) can both be filtering, so each thread gets its own set
+        self._buffers = threading.local()
+        warm_up()
+        
+        # Redraws and magnitude changes re-render the same timestamp, so keep the
+        # Time (with its nutation/precession) and the observer position around
+        self._t_cache = {}
+        self._observer_cache = {}
+        
+    @staticmethod
+    def _lru_get(cache: dict, key, compute):
+        """Return cache[key], computing it on a miss and evicting the least recently used entry"""
+        if key in cache:
+            value = cache.pop(key)
+        else:
+            value = compute()
+            if len(cache) >= _CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # Re-inserting moves the entry to the most recently used end
+        cache[key] = value
+        return value
+        
+    @property
+    def catalog_loaded(self) -> bool:
+        """Whether a magnitude-limited selection of the catalog is ready"""
+        return self._ra_hours is not None
         
     def load_star_catalog(self, max_magnitude: float = 6.0):
         """Load Hipparcos star catalog with magnitude filter"""
-        with load.open(hipparcos.URL) as f:
-            self.stars_df = hipparcos.load_dataframe(f)
+        if not self._catalog_loaded:
+            self._load_full_catalog()
+        self.set_magnitude_limit(max_magnitude)
+        
+    def _load_full_catalog(self):
+        """Parse the whole Hipparcos catalog into column arrays"""
+        cached = load_catalog_cache(_CATALOG_CACHE_PATH, _CATALOG_CACHE_VERSION, 'ra_hours', 'dec_degrees',
+                                    'magnitude', 'ra_mas_per_year', 'dec_mas_per_year', 'parallax_mas', 'epoch')
+        if cached is not None:
+            (self._all_ra_hours, self._all_dec_degrees, self._all_magnitudes, self._all_ra_mas_per_year,
+             self._all_dec_mas_per_year, self._all_parallax_mas, self._all_epoch) = cached
+            self._catalog_loaded = True
+            return
         
+        with load.open(hipparcos.URL) as f:
+            stars_df = hipparcos.load_dataframe(f)
+        
+        # A few hundred entries have no position or parallax. Drop them once here, so no
+        # NaN reaches the astrometry, the kernels or the float32 position buffers
+        stars_df = stars_df.dropna(subset=['ra_hours', 'dec_degrees', 'parallax_mas'])
+        
+        # Keep plain column arrays and let the DataFrame go
+        self._all_ra_hours = stars_df['ra_hours'].to_numpy()
+        self._all_dec_degrees = stars_df['dec_degrees'].to_numpy()
+        self._all_magnitudes = stars_df['magnitude'].to_numpy()
+        self._all_ra_mas_per_year = stars_df['ra_mas_per_year'].to_numpy()
+        self._all_dec_mas_per_year = stars_df['dec_mas_per_year'].to_numpy()
+        self._all_parallax_mas = stars_df['parallax_mas'].to_numpy()
+        # Same epoch conversion as Star.from_dataframe
+        self._all_epoch = 1721045.0 + stars_df['epoch_year'].to_numpy() * 365.25
+        self._catalog_loaded = True
+        
+        save_catalog_cache(_CATALOG_CACHE_PATH, _CATALOG_CACHE_VERSION, ra_hours=self._all_ra_hours,
+                           dec_degrees=self._all_dec_degrees, magnitude=self._all_magnitudes,
+                           ra_mas_per_year=self._all_ra_mas_per_year, dec_mas_per_year=self._all_dec_mas_per_year,
+                           parallax_mas=self._all_parallax_mas, epoch=self._all_epoch)
+        
+    def set_magnitude_limit(self, max_magnitude: float):
+        """Select the stars at or brighter than max_magnitude from the loaded catalog"""
+        self.max_magnitude = max_magnitude
         # Filter by magnitude (brightness)
-        self.stars_df = self.stars_df[self.stars_df['magnitude'] <= max_magnitude]
+        selected = np.flatnonzero(self._all_magnitudes <= max_magnitude)
+        self._ra_hours = self._all_ra_hours[selected]
+        self._dec_degrees = self._all_dec_degrees[selected]
+        self._magnitudes = self._all_magnitudes[selected]
+        self._ra_mas_per_year = self._all_ra_mas_per_year[selected]
+        self._dec_mas_per_year = self._all_dec_mas_per_year[selected]
+        self._parallax_mas = self._all_parallax_mas[selected]
+        self._epoch = self._all_epoch[selected]
+        
+        # Per-star sizes and color classes only depend on magnitude, so compute them once
+        self._sizes_all = np.clip(20 * (5 - self._magnitudes) + 1, 1, 50).astype(np.float32)
+        self._color_idx_all = np.searchsorted(_MAG_BINS, self._magnitudes, side='right').astype(np.int8)
+        
+        # J2000 coordinates in radians for the kernels. Float32 is ample for the chart
+        # and halves their memory traffic; Skyfield keeps the float64 columns above
+        self._ra_rad = np.radians(self._ra_hours * 15.0).astype(np.float32)
+        self._dec_rad = np.radians(self._dec_degrees).astype(np.float32)
+        
+        # A single Star whose fields are arrays lets Skyfield observe every star at once
+        self._stars_vec = Star(ra_hours=self._ra_hours, dec_degrees=self._dec_degrees,
+                               ra_mas_per_year=self._ra_mas_per_year,
+                               dec_mas_per_year=self._dec_mas_per_year,
+                               parallax_mas=self._parallax_mas, epoch=self._epoch)
         
     def set_observer_location(self, latitude: float, longitude: float, elevation: float = 0):
         """Set observer location on Earth"""
@@ -411,10 +746,11 @@ class SkySimulator:
                                                    longitude_degrees=longitude,
                                                    elevation_m=elevation)
         self.observer_coords = (latitude, longitude)
+        self.observer_elevation = elevation
         
     def get_star_positions(self, time: datetime, timezone: str = 'UTC') -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Calculate star positions for given time with timezone handling"""
-        if self.stars_df is None or self.observer_location is None:
+        if not self.catalog_loaded or self.observer_location is None:
             raise ValueError("Must load star catalog and set observer location first")
         
         # Ensure timezone-aware datetime
@@ -423,51 +759,151 @@ class SkySimulator:
         
         # Convert to UTC for astronomical calculations
         utc_time = time.astimezone(dt_timezone.utc)
-        t = self.ts.utc(utc_time.year, utc_time.month, utc_time.day, 
-                       utc_time.hour, utc_time.minute, utc_time.second)
-        observer = self.observer_location.at(t)
-        
-        star_positions = []
-        star_magnitudes = []
-        star_colors = []
-        
-        for _, star_data in self.stars_df.iterrows():
-            star = Star.from_dataframe(star_data)
-            astrometric = observer.observe(star)
-            
-            # Get altitude and azimuth
-            alt, az, _ = astrometric.apparent().altaz()
-            
-            # Only include stars above horizon
-            if alt.degrees > 0:
-                star_positions.append([az.degrees, alt.degrees])
-                star_magnitudes.append(star_data['magnitude'])
-                
-                # Color based on magnitude (brightness/temperature)
-                mag = star_data['magnitude']
-                if mag < 1:  # Very bright - blue/white hot stars
-                    star_colors.append('#87CEEB')  # Sky blue
-                elif mag < 2:  # Bright - white
-                    star_colors.append('white')
-                elif mag < 3:  # Medium - yellowish (like our sun)
-                    star_colors.append('#FFE4B5')  # Moccasin
-                elif mag < 4:  # Dim - orange
-                    star_colors.append('#FFA500')  # Orange
-                else:  # Very dim - red (cooler stars)
-                    star_colors.append('#FF6B6B')  # Light red
-        
-        if not star_positions:
+        if self.fast_mode:
+            return self._fast_star_positions(utc_time)
+        
+        key = (utc_time.year, utc_time.month, utc_time.day,
+               utc_time.hour, utc_time.minute, utc_time.second)
+        t = self._lru_get(self._t_cache, key, lambda: self.ts.utc(*key))
+        observer = self._lru_get(self._observer_cache,
+                                 (key, self.observer_coords, self.observer_elevation),
+                                 lambda: self.observer_location.at(t))
+        
+        # Only stars the approximate kernel puts near or above the horizon go through
+        # the full astrometry; its error is far smaller than the margin
+        approx_alt, _ = self._approximate_altaz(utc_time)
+        # The cull mask borrows this thread's float32 horizon mask buffer, which is free
+        # until visible_stars below (filtering float64 positions) needs its own
+        cull = self._output_buffers(len(approx_alt), approx_alt.dtype)[4][:len(approx_alt)]
+        candidates = np.flatnonzero(np.greater(approx_alt, _CULL_MARGIN_RAD, out=cull))
+        stars = Star(ra_hours=self._ra_hours[candidates], dec_degrees=self._dec_degrees[candidates],
+                     ra_mas_per_year=self._ra_mas_per_year[candidates],
+                     dec_mas_per_year=self._dec_mas_per_year[candidates],
+                     parallax_mas=self._parallax_mas[candidates], epoch=self._epoch[candidates])
+        
+        # Entries with missing or non-positive parallax can make the astrometry emit
+        # RuntimeWarnings; silence only those, and only around these calls
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            # One vectorized observation covers all candidate stars
+            alt, az, _ = observer.observe(stars).apparent().altaz()
+        return self.visible_stars(alt.degrees, az.degrees, candidates)
+        
+    def _approximate_altaz(self, utc_time: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """Kernel alt/az in radians (no nutation, aberration or proper motion), good to a few arcminutes
+        
+        Stars below the cull margin come back at -pi/2 with no azimuth.
+        """
+        # UT1 is taken as UTC; the sub-second difference is invisible on the chart
+        jd = utc_time.timestamp() / 86400.0 + UNIX_EPOCH_JD
+        ra, dec = precess_from_j2000(self._ra_rad, self._dec_rad, jd)
+        
+        lat, lon = self.observer_coords
+        phi = np.radians(lat)
+        alt = np.empty_like(ra)
+        az = np.empty_like(ra)
+        radec_to_altaz(ra, np.sin(dec), np.cos(dec), float(gmst_radians(jd) + np.radians(lon)),
+                       float(np.sin(phi)), float(np.cos(phi)), _CULL_MARGIN_SIN, alt, az)
+        return alt, az
+        
+    def _fast_star_positions(self, utc_time: datetime) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Approximate star positions straight from the kernel"""
+        alt, az = self._approximate_altaz(utc_time)
+        return self.visible_stars(np.degrees(alt), np.degrees(az) % 360.0)
+        
+    def visible_stars(self, star_alt: np.ndarray, star_az: np.ndarray, index: Optional[np.ndarray] = None,
+                      sizes: Optional[np.ndarray] = None,
+                      color_idx: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Filter altitudes/azimuths (degrees) down to the stars above the horizon
+        
+        The inputs cover the whole catalog, or the catalog rows listed in index. sizes and
+        color_idx default to the current selection; pass the ones returned with positions
+        that were computed for an earlier selection. Positions keep their dtype: float64
+        from Skyfield, float32 from the kernels and the animation. The filtering itself then
+        allocates nothing; in the culled Skyfield path the subset Star and its observation
+        still do.
+        """
+        if sizes is None:
+            sizes, color_idx = self._sizes_all, self._color_idx_all
+        out_az, out_alt, out_sizes, out_color_idx, mask, rows = self._output_buffers(len(star_alt), star_alt.dtype)
+        
+        # Only include stars above horizon
+        keep = np.greater(star_alt, 0, out=mask[:len(star_alt)])
+        count = np.count_nonzero(keep)
+        
+        if count == 0:
             return np.array([]), np.array([]), np.array([]), np.array([])
-            
-        positions = np.array(star_positions)
-        magnitudes = np.array(star_magnitudes)
-        colors = np.array(star_colors)
         
-        # Convert magnitude to point size (brighter = larger)
-        sizes = 20 * (5 - magnitudes) + 1
-        sizes = np.clip(sizes, 1, 50)
+        # The results are views into this thread's buffers, valid until its next call
+        out_az, out_alt = out_az[:count], out_alt[:count]
+        out_sizes, out_color_idx = out_sizes[:count], out_color_idx[:count]
+        np.compress(keep, star_az, out=out_az)
+        np.compress(keep, star_alt, out=out_alt)
+        if index is None:
+            np.compress(keep, sizes, out=out_sizes)
+            np.compress(keep, color_idx, out=out_color_idx)
+        else:
+            rows = np.compress(keep, index, out=rows[:count])
+            np.take(sizes, rows, out=out_sizes)
+            np.take(color_idx, rows, out=out_color_idx)
+        return out_az, out_alt, out_sizes, out_color_idx
+        
+    def _output_buffers(self, size: int, dtype: np.dtype) -> Tuple[np.ndarray, ...]:
+        """This thread's output buffers and horizon mask/row scratch, grown to hold size stars
+        
+        The az/alt buffers have the given dtype, so compressing positions of that dtype
+        into them never casts (and copies) the whole input first.
+        """
+        buffer_sets = getattr(self._buffers, 'sets', None)
+        if buffer_sets is None:
+            buffer_sets = self._buffers.sets = {}
+        buffers = buffer_sets.get(dtype)
+        if buffers is None or len(buffers[0]) < size:
+            buffers = (np.empty(size, dtype=dtype), np.empty(size, dtype=dtype),
+                       np.empty(size, dtype=np.float32), np.empty(size, dtype=np.int8),
+                       np.empty(size, dtype=bool), np.empty(size, dtype=np.intp))
+            buffer_sets[dtype] = buffers
+        return buffers
+        
+    def get_star_positions_series(self, times) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Altitude and azimuth (degrees) of every selected star at every time, shaped (frames, stars)
+        
+        The selection's sizes and color indices come back too, so the frames can still be
+        drawn after set_magnitude_limit picks a different set of stars.
+        """
+        if not self.catalog_loaded or self.observer_location is None:
+            raise ValueError("Must load star catalog and set observer location first")
         
-        return positions[:, 0], positions[:, 1], sizes, colors
+        # Ensure timezone-aware datetimes, then build one array-valued Time
+        utc_times = [(time if time.tzinfo is not None else time.replace(tzinfo=dt_timezone.utc))
+                     .astimezone(dt_timezone.utc) for time in times]
+        t = self.ts.utc(*(np.array([getattr(time, field) for time in utc_times])
+                          for field in ('year', 'month', 'day', 'hour', 'minute', 'second')))
+        
+        # Skyfield cannot observe an array of stars at an array of times in one call,
+        # so take the apparent places of date once; they drift by about an arcsecond
+        # per day, so over an animation only Earth's rotation (GAST) moves the stars
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            ra, dec, _ = self.observer_location.at(t[0]).observe(self._stars_vec).apparent().radec(epoch='date')
+        
+        # Closed-form equatorial to horizontal transform with H = GAST + longitude - RA,
+        # broadcasting frames (rows) against stars (columns). The (frames, stars) arrays
+        # are float32, which keeps an arcsecond-level chart at half the memory
+        lat, lon = self.observer_coords
+        phi = np.radians(lat)
+        sin_phi, cos_phi = float(np.sin(phi)), float(np.cos(phi))
+        local_sidereal = np.radians(np.atleast_1d(t.gast) * 15.0 + lon).astype(np.float32)
+        ra_rad = ra.radians.astype(np.float32)
+        dec_rad = dec.radians.astype(np.float32)
+        hour_angle = local_sidereal[:, np.newaxis] - ra_rad
+        cos_h = np.cos(hour_angle)
+        sin_dec, cos_dec = np.sin(dec_rad), np.cos(dec_rad)
+        sin_alt = sin_phi * sin_dec + cos_phi * cos_dec * cos_h
+        alt = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+        az = np.degrees(np.pi + np.arctan2(np.sin(hour_angle) * cos_dec,
+                                           cos_h * sin_phi * cos_dec - sin_dec * cos_phi))
+        return alt, az % 360.0, self._sizes_all, self._color_idx_all
 
 
 def main():